@@ -10,19 +10,40 @@ import json
 import re
 import asyncio
 import threading
-from typing import List, Dict, Optional, Union, Tuple, Any, Callable, Generic, TypeVar
+import time
+from typing import List, Dict, Optional, Union, Tuple, Type, Any, Callable, Generic, TypeVar
 from dataclasses import dataclass, field
 from enum import Enum, IntEnum, auto
-from collections import defaultdict, namedtuple
+from collections import Counter, namedtuple
 from contextlib import contextmanager
 from functools import wraps, lru_cache
+from itertools import islice
+from math import prod
 from pathlib import Path
 import datetime as dt
 
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    _loads = orjson.loads
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
+    _loads = json.loads
+
 # Constants
 MAX_SIZE = 100
 PI = 3.14159
 API_URL = "https://api.example.com"
+_HERE = Path(__file__)
+
+# Precompiled regular expressions
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_FIND_EMAIL_RE = re.compile(r'\b\w+@\w+\.\w+\b')
 
 # Type variables
 T = TypeVar('T')
@@ -41,7 +62,7 @@ class Priority(IntEnum):
     CRITICAL = auto()
 
 # Dataclass with type hints
-@dataclass
+@dataclass(slots=True)
 class Person:
     """A person with basic information."""
     name: str
@@ -71,8 +92,7 @@ class Person:
     @staticmethod
     def validate_email(email: str) -> bool:
         """Validate email format."""
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return re.match(pattern, email) is not None
+        return _EMAIL_RE.match(email) is not None
 
 # Regular class with inheritance
 class Employee(Person):
@@ -114,16 +134,22 @@ class Employee(Person):
 class Container(Generic[T]):
     """Generic container class."""
 
+    __slots__ = ('_items', '_snapshot')
+
     def __init__(self):
         self._items: List[T] = []
+        self._snapshot: Optional[Tuple[T, ...]] = None
 
     def add(self, item: T) -> None:
         """Add item to container."""
+        self._snapshot = None
         self._items.append(item)
 
-    def get_all(self) -> List[T]:
-        """Get all items."""
-        return self._items.copy()
+    def get_all(self) -> Tuple[T, ...]:
+        """Get all items as a read-only snapshot."""
+        if self._snapshot is None:
+            self._snapshot = tuple(self._items)
+        return self._snapshot
 
     def __len__(self) -> int:
         return len(self._items)
@@ -136,26 +162,31 @@ def timing_decorator(func: Callable) -> Callable:
     """Decorator to measure function execution time."""
     @wraps(func)
     def wrapper(*args, **kwargs):
-        start_time = dt.datetime.now()
+        start_time = time.perf_counter_ns()
         result = func(*args, **kwargs)
-        end_time = dt.datetime.now()
-        duration = end_time - start_time
-        print(f"{func.__name__} took {duration.total_seconds():.4f} seconds")
+        end_time = time.perf_counter_ns()
+        duration = (end_time - start_time) * 1e-9
+        print(f"{func.__name__} took {duration:.4f} seconds")
         return result
     return wrapper
 
-def retry(max_attempts: int = 3):
-    """Decorator with parameters for retry logic."""
+def retry(max_attempts: int = 3,
+          exceptions: Tuple[Type[BaseException], ...] = (Exception,),
+          base_delay: float = 0.0, verbose: bool = False):
+    """Decorator with parameters for retry logic and exponential backoff."""
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         def wrapper(*args, **kwargs):
             for attempt in range(max_attempts):
                 try:
                     return func(*args, **kwargs)
-                except Exception as e:
+                except exceptions as e:
                     if attempt == max_attempts - 1:
                         raise
-                    print(f"Attempt {attempt + 1} failed: {e}")
+                    if verbose:
+                        print(f"Attempt {attempt + 1} failed: {e}")
+                    if base_delay:
+                        time.sleep(base_delay * 2 ** attempt)
             return None
         return wrapper
     return decorator
@@ -173,12 +204,15 @@ def temporary_value(obj, attr: str, temp_value):
 
 # Regular functions
 def fibonacci(n: int) -> int:
-    """Calculate fibonacci number recursively."""
+    """Calculate fibonacci number iteratively."""
     if n <= 1:
         return n
-    return fibonacci(n - 1) + fibonacci(n - 2)
+    a, b = 0, 1
+    for _ in range(n):
+        a, b = b, a + b
+    return a
 
-@lru_cache(maxsize=128)
+@lru_cache(maxsize=None)
 def fibonacci_cached(n: int) -> int:
     """Cached fibonacci calculation."""
     if n <= 1:
@@ -189,26 +223,44 @@ def find_max(*args: Union[int, float]) -> Union[int, float]:
     """Find maximum value from variable arguments."""
     if not args:
         raise ValueError("At least one argument required")
+    if len(args) == 1:
+        return args[0]
     return max(args)
 
+def find_emails(text: str) -> List[str]:
+    """Find all email addresses in text."""
+    if "@" not in text:  # Cheap literal prefilter before the regex scan
+        return []
+    return _FIND_EMAIL_RE.findall(text)
+
 def process_data(data: List[Dict[str, Any]],
                 filter_func: Optional[Callable[[Dict], bool]] = None) -> List[Dict[str, Any]]:
     """Process data with optional filtering."""
     if filter_func is None:
-        filter_func = lambda x: True
+        return list(data)
 
     return [item for item in data if filter_func(item)]
 
 # Async functions
-async def fetch_data(url: str, timeout: float = 5.0) -> Dict[str, Any]:
+async def fetch_data(url: str, timeout: float = 5.0,
+                     timestamp: Optional[str] = None) -> Dict[str, Any]:
     """Simulate async data fetching."""
     await asyncio.sleep(0.1)  # Simulate network delay
-    return {"url": url, "data": "sample data", "timestamp": dt.datetime.now().isoformat()}
+    if timestamp is None:
+        timestamp = dt.datetime.now().isoformat()
+    return {"url": url, "data": "sample data", "timestamp": timestamp}
 
 async def gather_data(urls: List[str]) -> List[Dict[str, Any]]:
     """Gather data from multiple URLs concurrently."""
-    tasks = [fetch_data(url) for url in urls]
-    return await asyncio.gather(*tasks)
+    timestamp = dt.datetime.now().isoformat()  # One timestamp per batch
+    if not hasattr(asyncio, "TaskGroup"):  # Python < 3.11
+        return await asyncio.gather(*(fetch_data(url, timestamp=timestamp) for url in urls))
+    try:
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(fetch_data(url, timestamp=timestamp)) for url in urls]
+    except BaseExceptionGroup as group:
+        raise group.exceptions[0]  # Match gather: surface the first failure
+    return [task.result() for task in tasks]
 
 # Generator functions
 def number_generator(start: int, end: int, step: int = 1):
@@ -251,8 +303,8 @@ def main():
     set_var = {1, 2, 3, 4, 5}
 
     # List comprehensions
-    squares = [x**2 for x in range(10)]
-    even_squares = [x**2 for x in range(10) if x % 2 == 0]
+    squares = [x * x for x in range(10)]
+    even_squares = [x * x for x in range(0, 10, 2)]
 
     # Dictionary comprehensions
     square_dict = {x: x**2 for x in range(5)}
@@ -262,7 +314,7 @@ def main():
     even_set = {x for x in range(10) if x % 2 == 0}
 
     # Generator expressions
-    sum_of_squares = sum(x**2 for x in range(100))
+    sum_of_squares = sum(x * x for x in range(100))
 
     # Control flow structures
     for i in range(10):
@@ -338,21 +390,21 @@ def main():
         print(f"Container item: {item}")
 
     # Lambda functions
-    square = lambda x: x**2
     add = lambda a, b: a + b
 
     # Higher-order functions
     numbers = [1, 2, 3, 4, 5]
-    squared_numbers = list(map(square, numbers))
-    even_numbers = list(filter(lambda x: x % 2 == 0, numbers))
+    squared_numbers = [x * x for x in numbers]
+    even_numbers = [x for x in numbers if x % 2 == 0]
+    number_strings = list(map(str, numbers))
+    nonzero_numbers = list(filter(None, numbers))
 
-    # Reduce example
-    from functools import reduce
-    product = reduce(lambda a, b: a * b, numbers, 1)
+    # Product example
+    product = prod(numbers)
 
     # Decorators usage
     @timing_decorator
-    @retry(max_attempts=3)
+    @retry(max_attempts=3, exceptions=(RuntimeError,), verbose=True)
     def risky_function():
         """Function that might fail."""
         import random
@@ -368,7 +420,7 @@ def main():
 
     # Generator usage
     fib_gen = fibonacci_generator()
-    first_10_fibs = [next(fib_gen) for _ in range(10)]
+    first_10_fibs = list(islice(fib_gen, 10))
     print(f"First 10 Fibonacci numbers: {first_10_fibs}")
 
     # Named tuple
@@ -376,11 +428,9 @@ def main():
     point = Point(10, 20)
     print(f"Point: x={point.x}, y={point.y}")
 
-    # Default dict
-    word_count = defaultdict(int)
+    # Counter
     text = "hello world hello python"
-    for word in text.split():
-        word_count[word] += 1
+    word_count = Counter(text.split())
 
     # Enum usage
     current_status = Status.ACTIVE
@@ -390,20 +440,18 @@ def main():
     print(f"Priority: {priority.name} ({priority.value})")
 
     # Regular expressions
-    pattern = r'\b\w+@\w+\.\w+\b'
     text = "Contact us at support@example.com or sales@company.org"
-    emails = re.findall(pattern, text)
+    emails = find_emails(text)
     print(f"Found emails: {emails}")
 
     # JSON operations
     data = {"name": "John", "age": 30, "city": "New York"}
-    json_string = json.dumps(data, indent=2)
-    parsed_data = json.loads(json_string)
+    json_bytes = _dumps(data)
+    parsed_data = _loads(json_bytes)
 
     # Path operations
-    current_file = Path(__file__)
-    print(f"Current file: {current_file.name}")
-    print(f"Parent directory: {current_file.parent}")
+    print(f"Current file: {_HERE.name}")
+    print(f"Parent directory: {_HERE.parent}")
 
     # String operations
     text = "  Hello, World!  "